@@ -5,60 +5,56 @@ This module contains all Pydantic models for event validation and serialization.
 It includes comprehensive event schemas for an e-commerce platform.
 """
 
-from .events import (
-    BaseEvent,
-    CartAbandonedEvent,
-    CartItemAddedEvent,
-    CartItemRemovedEvent,
-    EventModel,
-    EventType,
-    InventoryLowStockEvent,
-    InventoryOutOfStockEvent,
-    InventoryRestockedEvent,
-    OrderCreatedEvent,
-    OrderDeliveredEvent,
-    OrderPaidEvent,
-    OrderShippedEvent,
-    PageViewEvent,
-    PaymentFailedEvent,
-    PaymentProcessedEvent,
-    PaymentRefundedEvent,
-    ProductSearchedEvent,
-    ProductViewedEvent,
-    ReviewSubmittedEvent,
-    UserDeletedEvent,
-    UserLoginEvent,
-    UserLogoutEvent,
-    UserProfileUpdatedEvent,
-    UserRegisteredEvent,
-    UserSessionEvent,
-)
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
-    "EventType",
-    "BaseEvent",
-    "EventModel",
-    "UserRegisteredEvent",
-    "UserLoginEvent",
-    "UserLogoutEvent",
-    "UserProfileUpdatedEvent",
-    "UserDeletedEvent",
-    "ProductViewedEvent",
-    "ProductSearchedEvent",
-    "CartItemAddedEvent",
-    "CartItemRemovedEvent",
-    "CartAbandonedEvent",
-    "OrderCreatedEvent",
-    "OrderPaidEvent",
-    "OrderShippedEvent",
-    "OrderDeliveredEvent",
-    "InventoryLowStockEvent",
-    "InventoryOutOfStockEvent",
-    "InventoryRestockedEvent",
-    "PaymentProcessedEvent",
-    "PaymentFailedEvent",
-    "PaymentRefundedEvent",
-    "ReviewSubmittedEvent",
-    "UserSessionEvent",
-    "PageViewEvent",
-]
+if TYPE_CHECKING:
+    from .events import (
+        EVENT_ADAPTER,
+        EVENT_TYPE_TO_CLASS,
+        AnyEvent,
+        BaseEvent,
+        CartAbandonedEvent,
+        CartItemAddedEvent,
+        CartItemRemovedEvent,
+        EventModel,
+        EventType,
+        InventoryLowStockEvent,
+        InventoryOutOfStockEvent,
+        InventoryRestockedEvent,
+        OrderCreatedEvent,
+        OrderDeliveredEvent,
+        OrderPaidEvent,
+        OrderShippedEvent,
+        PageViewEvent,
+        PaymentFailedEvent,
+        PaymentProcessedEvent,
+        PaymentRefundedEvent,
+        ProductSearchedEvent,
+        ProductViewedEvent,
+        ReviewSubmittedEvent,
+        UserDeletedEvent,
+        UserLoginEvent,
+        UserLogoutEvent,
+        UserProfileUpdatedEvent,
+        UserRegisteredEvent,
+        UserSessionEvent,
+        parse_event,
+    )
+
+# The events package itself is cheap to import; only its submodules are lazy
+from . import events
+
+__all__ = list(events.__all__)
+
+
+def __getattr__(name: str) -> Any:
+    # Defer to the lazy events package so importing ``models`` stays cheap
+    if name in __all__:
+        value = getattr(events, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted([*__all__, "events"])
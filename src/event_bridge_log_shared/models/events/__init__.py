@@ -7,104 +7,110 @@ This package contains all event models organized by domain:
 - inventory: Stock management events
 - payment: Financial transaction events
 - analytics: User behavior and analytics events
-"""
 
-from typing import Union
+Submodules are imported lazily on first attribute access (PEP 562), so a
+service that only uses, say, payment events does not build the models for
+every other domain at import time.
+"""
 
-from .analytics import (
-    PageViewEvent,
-    ReviewSubmittedEvent,
-    UserSessionEvent,
-)
-from .base import BaseEvent, EventType
-from .ecommerce import (
-    CartAbandonedEvent,
-    CartItemAddedEvent,
-    CartItemRemovedEvent,
-    OrderCreatedEvent,
-    OrderDeliveredEvent,
-    OrderPaidEvent,
-    OrderShippedEvent,
-    ProductSearchedEvent,
-    ProductViewedEvent,
-)
-from .inventory import (
-    InventoryLowStockEvent,
-    InventoryOutOfStockEvent,
-    InventoryRestockedEvent,
-)
-from .payment import (
-    PaymentFailedEvent,
-    PaymentProcessedEvent,
-    PaymentRefundedEvent,
-)
-from .user import (
-    UserDeletedEvent,
-    UserLoginEvent,
-    UserLogoutEvent,
-    UserProfileUpdatedEvent,
-    UserRegisteredEvent,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
 
-EventModel = (
-    # PEP 604 union style
-    UserRegisteredEvent
-    | UserLoginEvent
-    | UserLogoutEvent
-    | UserProfileUpdatedEvent
-    | UserDeletedEvent
-    | ProductViewedEvent
-    | ProductSearchedEvent
-    | CartItemAddedEvent
-    | CartItemRemovedEvent
-    | CartAbandonedEvent
-    | OrderCreatedEvent
-    | OrderPaidEvent
-    | OrderShippedEvent
-    | OrderDeliveredEvent
-    | InventoryLowStockEvent
-    | InventoryOutOfStockEvent
-    | InventoryRestockedEvent
-    | PaymentProcessedEvent
-    | PaymentFailedEvent
-    | PaymentRefundedEvent
-    | ReviewSubmittedEvent
-    | UserSessionEvent
-    | PageViewEvent
-)
+if TYPE_CHECKING:
+    from .analytics import (
+        PageViewEvent,
+        ReviewSubmittedEvent,
+        UserSessionEvent,
+    )
+    from .base import BaseEvent, EventType
+    from .ecommerce import (
+        CartAbandonedEvent,
+        CartItemAddedEvent,
+        CartItemRemovedEvent,
+        OrderCreatedEvent,
+        OrderDeliveredEvent,
+        OrderPaidEvent,
+        OrderShippedEvent,
+        ProductSearchedEvent,
+        ProductViewedEvent,
+    )
+    from .inventory import (
+        InventoryLowStockEvent,
+        InventoryOutOfStockEvent,
+        InventoryRestockedEvent,
+    )
+    from .payment import (
+        PaymentFailedEvent,
+        PaymentProcessedEvent,
+        PaymentRefundedEvent,
+    )
+    from .registry import EVENT_ADAPTER, EVENT_TYPE_TO_CLASS, AnyEvent, EventModel, parse_event
+    from .user import (
+        UserDeletedEvent,
+        UserLoginEvent,
+        UserLogoutEvent,
+        UserProfileUpdatedEvent,
+        UserRegisteredEvent,
+    )
 
-__all__ = [
+# Public name -> submodule that defines it
+_LAZY_IMPORTS: dict[str, str] = {
     # Base classes
-    "EventType",
-    "BaseEvent",
+    "EventType": "base",
+    "BaseEvent": "base",
     # User events
-    "UserRegisteredEvent",
-    "UserLoginEvent",
-    "UserLogoutEvent",
-    "UserProfileUpdatedEvent",
-    "UserDeletedEvent",
+    "UserRegisteredEvent": "user",
+    "UserLoginEvent": "user",
+    "UserLogoutEvent": "user",
+    "UserProfileUpdatedEvent": "user",
+    "UserDeletedEvent": "user",
     # E-commerce events
-    "ProductViewedEvent",
-    "ProductSearchedEvent",
-    "CartItemAddedEvent",
-    "CartItemRemovedEvent",
-    "CartAbandonedEvent",
-    "OrderCreatedEvent",
-    "OrderPaidEvent",
-    "OrderShippedEvent",
-    "OrderDeliveredEvent",
+    "ProductViewedEvent": "ecommerce",
+    "ProductSearchedEvent": "ecommerce",
+    "CartItemAddedEvent": "ecommerce",
+    "CartItemRemovedEvent": "ecommerce",
+    "CartAbandonedEvent": "ecommerce",
+    "OrderCreatedEvent": "ecommerce",
+    "OrderPaidEvent": "ecommerce",
+    "OrderShippedEvent": "ecommerce",
+    "OrderDeliveredEvent": "ecommerce",
     # Inventory events
-    "InventoryLowStockEvent",
-    "InventoryOutOfStockEvent",
-    "InventoryRestockedEvent",
+    "InventoryLowStockEvent": "inventory",
+    "InventoryOutOfStockEvent": "inventory",
+    "InventoryRestockedEvent": "inventory",
     # Payment events
-    "PaymentProcessedEvent",
-    "PaymentFailedEvent",
-    "PaymentRefundedEvent",
+    "PaymentProcessedEvent": "payment",
+    "PaymentFailedEvent": "payment",
+    "PaymentRefundedEvent": "payment",
     # Analytics events
-    "ReviewSubmittedEvent",
-    "UserSessionEvent",
-    "PageViewEvent",
-    # Union type
-    "EventModel",
-]
+    "ReviewSubmittedEvent": "analytics",
+    "UserSessionEvent": "analytics",
+    "PageViewEvent": "analytics",
+    # Union types and parsing
+    "AnyEvent": "registry",
+    "EventModel": "registry",
+    "EVENT_ADAPTER": "registry",
+    "EVENT_TYPE_TO_CLASS": "registry",
+    "parse_event": "registry",
+}
+
+_SUBMODULES = frozenset(_LAZY_IMPORTS.values())
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name in _SUBMODULES:
+        # import_module also binds the submodule on the package
+        return importlib.import_module(f".{name}", __name__)
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    # Cache on the package so later lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*__all__, *_SUBMODULES])
@@ -6,16 +6,23 @@ session tracking, and other analytics data.
 """
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import ConfigDict, Field
 
 from .base import BaseEvent, EventType
 
+__all__ = [
+    "ReviewSubmittedEvent",
+    "UserSessionEvent",
+    "PageViewEvent",
+]
+
 
 class ReviewSubmittedEvent(BaseEvent):
     """Event emitted when a user submits a product review."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.REVIEW_SUBMITTED] = Field(
         default=EventType.REVIEW_SUBMITTED, description="Review submitted event"
     )
 
@@ -69,7 +76,9 @@ class ReviewSubmittedEvent(BaseEvent):
 class UserSessionEvent(BaseEvent):
     """Event emitted for user session tracking and analytics."""
 
-    event_type: EventType = Field(default=EventType.USER_SESSION, description="User session event")
+    event_type: Literal[EventType.USER_SESSION] = Field(
+        default=EventType.USER_SESSION, description="User session event"
+    )
 
     # Session details
     session_id: str = Field(..., description="Unique session identifier")
@@ -130,7 +139,9 @@ class UserSessionEvent(BaseEvent):
 class PageViewEvent(BaseEvent):
     """Event emitted when a user views a page."""
 
-    event_type: EventType = Field(default=EventType.PAGE_VIEW, description="Page view event")
+    event_type: Literal[EventType.PAGE_VIEW] = Field(
+        default=EventType.PAGE_VIEW, description="Page view event"
+    )
 
     # Page information
     page_url: str = Field(..., description="Full page URL")
@@ -12,6 +12,13 @@ from uuid import UUID, uuid4
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator
 
+__all__ = [
+    "EventType",
+    "BaseEvent",
+]
+
+_VALID_ENVIRONMENTS = frozenset({"development", "staging", "production", "testing"})
+
 
 class EventType(str, Enum):
     """
@@ -55,6 +62,10 @@ class EventType(str, Enum):
     PAGE_VIEW = "page.view"
 
 
+# Plain string value per member; a dict hit is cheaper than the enum ``.value`` descriptor.
+_EVENT_TYPE_VALUES: dict[EventType, str] = {member: member.value for member in EventType}
+
+
 class BaseEvent(BaseModel):
     """
     Base event model that all events inherit from.
@@ -96,9 +107,8 @@ class BaseEvent(BaseModel):
     @field_validator("environment")
     def validate_environment(cls: type[Any], v: str) -> str:
         """Validate environment value."""
-        valid_environments = {"development", "staging", "production", "testing"}
-        if v not in valid_environments:
-            raise ValueError(f"Environment must be one of: {valid_environments}")
+        if v not in _VALID_ENVIRONMENTS:
+            raise ValueError(f"Environment must be one of: {sorted(_VALID_ENVIRONMENTS)}")
         return v
 
     @field_validator("timestamp", "created_at", mode="before")
@@ -110,14 +120,14 @@ class BaseEvent(BaseModel):
 
     def get_event_key(self) -> str:
         """Get the event key for partitioning and ordering."""
-        return f"{self.event_type.value}:{self.timestamp.isoformat()}:{self.event_id}"
+        return f"{_EVENT_TYPE_VALUES[self.event_type]}:{self.timestamp.isoformat()}:{self.event_id}"
 
     def to_event_bridge_format(self) -> dict[str, Any]:
         """Convert to AWS EventBridge format."""
         return {
             "Source": self.source,
-            "DetailType": self.event_type.value,
-            "Detail": self.json(),
+            "DetailType": _EVENT_TYPE_VALUES[self.event_type],
+            "Detail": self.model_dump_json(),
             "Time": self.timestamp,
             "Resources": [],
             "EventBusName": "default",
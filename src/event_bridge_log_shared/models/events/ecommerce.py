@@ -7,17 +7,29 @@ operations, and order management.
 
 from datetime import datetime
 from decimal import Decimal
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import ConfigDict, Field
 
 from .base import BaseEvent, EventType
 
+__all__ = [
+    "ProductViewedEvent",
+    "ProductSearchedEvent",
+    "CartItemAddedEvent",
+    "CartItemRemovedEvent",
+    "CartAbandonedEvent",
+    "OrderCreatedEvent",
+    "OrderPaidEvent",
+    "OrderShippedEvent",
+    "OrderDeliveredEvent",
+]
+
 
 class ProductViewedEvent(BaseEvent):
     """Event emitted when a user views a product."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.PRODUCT_VIEWED] = Field(
         default=EventType.PRODUCT_VIEWED, description="Product view event"
     )
 
@@ -56,7 +68,7 @@ class ProductViewedEvent(BaseEvent):
 class ProductSearchedEvent(BaseEvent):
     """Event emitted when a user searches for products."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.PRODUCT_SEARCHED] = Field(
         default=EventType.PRODUCT_SEARCHED, description="Product search event"
     )
 
@@ -91,7 +103,7 @@ class ProductSearchedEvent(BaseEvent):
 class CartItemAddedEvent(BaseEvent):
     """Event emitted when an item is added to the shopping cart."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.CART_ITEM_ADDED] = Field(
         default=EventType.CART_ITEM_ADDED, description="Cart item added event"
     )
 
@@ -128,7 +140,7 @@ class CartItemAddedEvent(BaseEvent):
 class CartItemRemovedEvent(BaseEvent):
     """Event emitted when an item is removed from the shopping cart."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.CART_ITEM_REMOVED] = Field(
         default=EventType.CART_ITEM_REMOVED, description="Cart item removed event"
     )
 
@@ -165,7 +177,7 @@ class CartItemRemovedEvent(BaseEvent):
 class CartAbandonedEvent(BaseEvent):
     """Event emitted when a shopping cart is abandoned."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.CART_ABANDONED] = Field(
         default=EventType.CART_ABANDONED, description="Cart abandoned event"
     )
 
@@ -200,7 +212,7 @@ class CartAbandonedEvent(BaseEvent):
 class OrderCreatedEvent(BaseEvent):
     """Event emitted when a new order is created."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.ORDER_CREATED] = Field(
         default=EventType.ORDER_CREATED, description="Order created event"
     )
 
@@ -270,7 +282,9 @@ class OrderCreatedEvent(BaseEvent):
 class OrderPaidEvent(BaseEvent):
     """Event emitted when an order payment is processed."""
 
-    event_type: EventType = Field(default=EventType.ORDER_PAID, description="Order paid event")
+    event_type: Literal[EventType.ORDER_PAID] = Field(
+        default=EventType.ORDER_PAID, description="Order paid event"
+    )
 
     # Order information
     order_id: str = Field(..., description="Order identifier")
@@ -315,7 +329,7 @@ class OrderPaidEvent(BaseEvent):
 class OrderShippedEvent(BaseEvent):
     """Event emitted when an order is shipped."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.ORDER_SHIPPED] = Field(
         default=EventType.ORDER_SHIPPED, description="Order shipped event"
     )
 
@@ -358,7 +372,7 @@ class OrderShippedEvent(BaseEvent):
 class OrderDeliveredEvent(BaseEvent):
     """Event emitted when an order is delivered."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.ORDER_DELIVERED] = Field(
         default=EventType.ORDER_DELIVERED, description="Order delivered event"
     )
 
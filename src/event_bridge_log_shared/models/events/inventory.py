@@ -7,16 +7,23 @@ and warehouse operations.
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import ConfigDict, Field
 
 from .base import BaseEvent, EventType
 
+__all__ = [
+    "InventoryLowStockEvent",
+    "InventoryOutOfStockEvent",
+    "InventoryRestockedEvent",
+]
+
 
 class InventoryLowStockEvent(BaseEvent):
     """Event emitted when inventory levels fall below threshold."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.INVENTORY_LOW_STOCK] = Field(
         default=EventType.INVENTORY_LOW_STOCK, description="Low stock alert event"
     )
 
@@ -60,7 +67,7 @@ class InventoryLowStockEvent(BaseEvent):
 class InventoryOutOfStockEvent(BaseEvent):
     """Event emitted when a product goes out of stock."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.INVENTORY_OUT_OF_STOCK] = Field(
         default=EventType.INVENTORY_OUT_OF_STOCK, description="Out of stock event"
     )
 
@@ -112,7 +119,7 @@ class InventoryOutOfStockEvent(BaseEvent):
 class InventoryRestockedEvent(BaseEvent):
     """Event emitted when inventory is restocked."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.INVENTORY_RESTOCKED] = Field(
         default=EventType.INVENTORY_RESTOCKED, description="Inventory restocked event"
     )
 
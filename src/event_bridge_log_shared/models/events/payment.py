@@ -7,16 +7,23 @@ and payment lifecycle management.
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import ConfigDict, Field
 
 from .base import BaseEvent, EventType
 
+__all__ = [
+    "PaymentProcessedEvent",
+    "PaymentFailedEvent",
+    "PaymentRefundedEvent",
+]
+
 
 class PaymentProcessedEvent(BaseEvent):
     """Event emitted when a payment is successfully processed."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.PAYMENT_PROCESSED] = Field(
         default=EventType.PAYMENT_PROCESSED, description="Payment processed event"
     )
 
@@ -75,7 +82,7 @@ class PaymentProcessedEvent(BaseEvent):
 class PaymentFailedEvent(BaseEvent):
     """Event emitted when a payment processing fails."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.PAYMENT_FAILED] = Field(
         default=EventType.PAYMENT_FAILED, description="Payment failed event"
     )
 
@@ -138,7 +145,7 @@ class PaymentFailedEvent(BaseEvent):
 class PaymentRefundedEvent(BaseEvent):
     """Event emitted when a payment is refunded."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.PAYMENT_REFUNDED] = Field(
         default=EventType.PAYMENT_REFUNDED, description="Payment refunded event"
     )
 
@@ -0,0 +1,99 @@
+"""
+Registry of all concrete event models.
+
+Importing this module loads every event domain module, so the package
+``__init__`` only imports it when one of these names is first used.
+"""
+
+from typing import Annotated, get_args
+
+from pydantic import Field, TypeAdapter
+
+from .analytics import (
+    PageViewEvent,
+    ReviewSubmittedEvent,
+    UserSessionEvent,
+)
+from .base import BaseEvent, EventType
+from .ecommerce import (
+    CartAbandonedEvent,
+    CartItemAddedEvent,
+    CartItemRemovedEvent,
+    OrderCreatedEvent,
+    OrderDeliveredEvent,
+    OrderPaidEvent,
+    OrderShippedEvent,
+    ProductSearchedEvent,
+    ProductViewedEvent,
+)
+from .inventory import (
+    InventoryLowStockEvent,
+    InventoryOutOfStockEvent,
+    InventoryRestockedEvent,
+)
+from .payment import (
+    PaymentFailedEvent,
+    PaymentProcessedEvent,
+    PaymentRefundedEvent,
+)
+from .user import (
+    UserDeletedEvent,
+    UserLoginEvent,
+    UserLogoutEvent,
+    UserProfileUpdatedEvent,
+    UserRegisteredEvent,
+)
+
+__all__ = [
+    "AnyEvent",
+    "EventModel",
+    "EVENT_ADAPTER",
+    "EVENT_TYPE_TO_CLASS",
+    "parse_event",
+]
+
+# Plain union of every concrete event class; usable with isinstance().
+AnyEvent = (
+    UserRegisteredEvent
+    | UserLoginEvent
+    | UserLogoutEvent
+    | UserProfileUpdatedEvent
+    | UserDeletedEvent
+    | ProductViewedEvent
+    | ProductSearchedEvent
+    | CartItemAddedEvent
+    | CartItemRemovedEvent
+    | CartAbandonedEvent
+    | OrderCreatedEvent
+    | OrderPaidEvent
+    | OrderShippedEvent
+    | OrderDeliveredEvent
+    | InventoryLowStockEvent
+    | InventoryOutOfStockEvent
+    | InventoryRestockedEvent
+    | PaymentProcessedEvent
+    | PaymentFailedEvent
+    | PaymentRefundedEvent
+    | ReviewSubmittedEvent
+    | UserSessionEvent
+    | PageViewEvent
+)
+
+# Discriminated on the Literal ``event_type`` tag of each event class, so
+# validation dispatches straight to the matching model instead of trying
+# every member of the union in turn.
+EventModel = Annotated[AnyEvent, Field(discriminator="event_type")]
+
+# O(1) lookup from an event type to its model, for consumers that route
+# events to handlers by type. Derived from AnyEvent so the two never drift.
+EVENT_TYPE_TO_CLASS: dict[EventType, type[BaseEvent]] = {
+    cls.model_fields["event_type"].default: cls for cls in get_args(AnyEvent)
+}
+
+# Built once at import so every parse reuses the same compiled validator.
+EVENT_ADAPTER: TypeAdapter[EventModel] = TypeAdapter(EventModel)
+
+
+def parse_event(raw: str | bytes) -> EventModel:
+    """Parse a JSON-encoded event into its concrete event class."""
+    return EVENT_ADAPTER.validate_json(raw)
@@ -5,17 +5,25 @@ This module contains events related to user authentication, profile management,
 and user lifecycle events.
 """
 
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import ConfigDict, Field
 
 from .base import BaseEvent, EventType
 
+__all__ = [
+    "UserRegisteredEvent",
+    "UserLoginEvent",
+    "UserLogoutEvent",
+    "UserProfileUpdatedEvent",
+    "UserDeletedEvent",
+]
+
 
 class UserRegisteredEvent(BaseEvent):
     """Event emitted when a new user registers."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.USER_REGISTERED] = Field(
         default=EventType.USER_REGISTERED, description="User registration event"
     )
 
@@ -56,7 +64,9 @@ class UserRegisteredEvent(BaseEvent):
 class UserLoginEvent(BaseEvent):
     """Event emitted when a user logs in."""
 
-    event_type: EventType = Field(default=EventType.USER_LOGIN, description="User login event")
+    event_type: Literal[EventType.USER_LOGIN] = Field(
+        default=EventType.USER_LOGIN, description="User login event"
+    )
 
     # Login details
     login_method: str = Field(..., description="Authentication method used")
@@ -89,7 +99,9 @@ class UserLoginEvent(BaseEvent):
 class UserLogoutEvent(BaseEvent):
     """Event emitted when a user logs out."""
 
-    event_type: EventType = Field(default=EventType.USER_LOGOUT, description="User logout event")
+    event_type: Literal[EventType.USER_LOGOUT] = Field(
+        default=EventType.USER_LOGOUT, description="User logout event"
+    )
 
     # Logout details
     logout_method: str = Field(..., description="How user logged out (manual, timeout, etc.)")
@@ -114,7 +126,7 @@ class UserLogoutEvent(BaseEvent):
 class UserProfileUpdatedEvent(BaseEvent):
     """Event emitted when a user updates their profile."""
 
-    event_type: EventType = Field(
+    event_type: Literal[EventType.USER_PROFILE_UPDATED] = Field(
         default=EventType.USER_PROFILE_UPDATED, description="User profile update event"
     )
 
@@ -145,7 +157,9 @@ class UserProfileUpdatedEvent(BaseEvent):
 class UserDeletedEvent(BaseEvent):
     """Event emitted when a user account is deleted."""
 
-    event_type: EventType = Field(default=EventType.USER_DELETED, description="User deleted event")
+    event_type: Literal[EventType.USER_DELETED] = Field(
+        default=EventType.USER_DELETED, description="User deleted event"
+    )
 
     # Deletion context
     deletion_reason: str | None = Field(None, description="Reason for account deletion")
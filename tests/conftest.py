@@ -2,54 +2,54 @@
 Shared test fixtures and configuration.
 """
 
+from types import MappingProxyType
+
 import pytest
 
+from event_bridge_log_shared.models.events.base import BaseEvent, EventType
+from event_bridge_log_shared.models.events.user import UserLoginEvent, UserRegisteredEvent
 
-@pytest.fixture
-def sample_user_data():
-    """Sample user data for testing."""
-    return {
-        "user_id": "user-12345",
-        "email": "test@example.com",
-        "username": "testuser",
-        "first_name": "Test",
-        "last_name": "User",
-    }
+from sample_data import BASE_LOGIN_METADATA, USER_LOGIN_PAYLOAD, USER_REG_PAYLOAD
+
+# Environment variables that mock_environment removes for the duration of a test
+ENV_VARS_TO_CLEAR = (
+    "ENVIRONMENT",
+    "DEBUG",
+    "LOG_LEVEL",
+    "AWS_REGION",
+    "AWS_DEV_ACCOUNT_ID",
+    "AWS_PROD_ACCOUNT_ID",
+)
 
 
 @pytest.fixture
-def sample_order_data():
-    """Sample order data aligned with OrderCreatedEvent model."""
-    return {
-        "user_id": "user-12345",
-        "order_id": "order-67890",
-        "order_number": "ORD-67890",
-        "order_total": 149.99,
-        "order_status": "created",
-        "items": [],
-        "item_count": 0,
-        "customer_email": "test@example.com",
-        "shipping_address": {"street": "1 Main St"},
-        "billing_address": {"street": "1 Main St"},
-        "payment_method": "credit_card",
-        "shipping_method": "standard",
-    }
+def mock_environment(monkeypatch):
+    """Fixture to provide clean environment for testing."""
+    # Clear relevant environment variables; monkeypatch restores only these afterwards
+    for var in ENV_VARS_TO_CLEAR:
+        monkeypatch.delenv(var, raising=False)
 
 
-@pytest.fixture
-def sample_payment_data():
-    """Sample payment data aligned with PaymentProcessedEvent model."""
-    return {
-        "user_id": "user-12345",
-        "order_id": "order-67890",
-        "order_number": "ORD-67890",
-        "payment_id": "pay-abcdef",
-        "payment_method": "credit_card",
-        "payment_amount": 149.99,
-        "payment_currency": "USD",
-        "transaction_id": "txn-123",
-        "processor": "stripe",
-        "processing_time_ms": 120,
-        "customer_id": "user-12345",
-        "customer_email": "test@example.com",
+@pytest.fixture(scope="session")
+def sample_events():
+    """
+    Prebuilt events shared across the session; read them, or model_copy() to change them.
+
+    The mapping is read-only but the events are not, so teardown checks that
+    no test mutated one in place.
+    """
+    events = {
+        "base_order": BaseEvent(event_type=EventType.ORDER_CREATED, source="test.api"),
+        "base_login": BaseEvent(
+            event_type=EventType.USER_LOGIN,
+            source="auth.service",
+            metadata=BASE_LOGIN_METADATA,
+        ),
+        "user_registered": UserRegisteredEvent(**USER_REG_PAYLOAD),
+        "user_login": UserLoginEvent(**USER_LOGIN_PAYLOAD),
     }
+    snapshot = {name: event.model_dump() for name, event in events.items()}
+
+    yield MappingProxyType(events)
+
+    assert {name: event.model_dump() for name, event in events.items()} == snapshot
@@ -0,0 +1,69 @@
+"""
+Constructor payloads shared by the test modules and fixtures.
+
+Every level is read-only (MappingProxyType/tuple), so a test that edits a
+payload fails loudly instead of leaking the change into later tests.
+"""
+
+from types import MappingProxyType
+
+_TEST_ADDRESS = MappingProxyType({"line1": "123 Test St", "city": "Testville"})
+
+USER_REG_PAYLOAD = MappingProxyType(
+    {
+        "user_id": "user123",
+        "email": "test@example.com",
+        "username": "testuser",
+        "source": "test.api",
+        "registration_method": "email",
+        "terms_accepted": True,
+    }
+)
+
+ORDER_PAYLOAD = MappingProxyType(
+    {
+        "user_id": "user123",
+        "order_id": "order456",
+        "source": "checkout.service",
+        "order_number": "ORD-456",
+        "order_total": 99.99,
+        "order_status": "created",
+        "items": (),
+        "item_count": 0,
+        "customer_email": "test@example.com",
+        "shipping_address": _TEST_ADDRESS,
+        "billing_address": _TEST_ADDRESS,
+        "payment_method": "credit_card",
+        "shipping_method": "standard",
+    }
+)
+
+PAYMENT_PAYLOAD = MappingProxyType(
+    {
+        "user_id": "user123",
+        "order_id": "order456",
+        "payment_id": "pay789",
+        "transaction_id": "txn_1",
+        "payment_amount": 99.99,
+        "payment_currency": "USD",
+        "processor": "stripe",
+        "processing_time_ms": 120,
+        "order_number": "ORD-456",
+        "customer_id": "user123",
+        "customer_email": "test@example.com",
+        "payment_method": "credit_card",
+        "source": "payments.service",
+    }
+)
+
+USER_LOGIN_PAYLOAD = MappingProxyType(
+    {
+        "user_id": "user123",
+        "session_id": "sess123",
+        "source": "test.api",
+        "login_method": "password",
+        "login_successful": True,
+    }
+)
+
+BASE_LOGIN_METADATA = MappingProxyType({"test_flag": True, "request_id": "req-123"})
@@ -2,58 +2,82 @@
 Test suite for event models.
 """
 
-from datetime import datetime
-from uuid import UUID
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
 
 import pytest
-
+from pydantic import ValidationError
+
+from event_bridge_log_shared.models.events import (
+    EVENT_ADAPTER,
+    EVENT_TYPE_TO_CLASS,
+    AnyEvent,
+    parse_event,
+)
 from event_bridge_log_shared.models.events.analytics import UserSessionEvent
 from event_bridge_log_shared.models.events.base import BaseEvent, EventType
 from event_bridge_log_shared.models.events.ecommerce import OrderCreatedEvent, ProductViewedEvent
 from event_bridge_log_shared.models.events.payment import PaymentProcessedEvent
 from event_bridge_log_shared.models.events.user import UserLoginEvent, UserRegisteredEvent
 
+from sample_data import BASE_LOGIN_METADATA, ORDER_PAYLOAD, PAYMENT_PAYLOAD, USER_REG_PAYLOAD
+
+FIXED_SESSION_START = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 class TestBaseEvent:
     """Test BaseEvent functionality."""
 
-    def test_base_event_creation(self):
-        """Test basic event creation."""
-        event = BaseEvent(event_type=EventType.USER_REGISTERED, source="test.source")
+    @pytest.mark.parametrize(
+        "event_type,source",
+        [
+            (EventType.USER_REGISTERED, "test.source"),
+            (EventType.ORDER_CREATED, "test.api"),
+            (EventType.PAYMENT_FAILED, "payments.service"),
+        ],
+    )
+    def test_base_event_creation_and_serialization(self, event_type, source):
+        """Test basic event creation and serialization."""
+        event = BaseEvent(event_type=event_type, source=source)
 
-        assert event.event_type == EventType.USER_REGISTERED
-        assert event.source == "test.source"
+        assert event.event_type == event_type
+        assert event.source == source
         assert isinstance(event.event_id, UUID)
         assert isinstance(event.timestamp, datetime)
         assert event.environment in ["development", "production", "dev", "prod"]
 
-    def test_base_event_serialization(self):
-        """Test event serialization."""
-        event = BaseEvent(event_type=EventType.ORDER_CREATED, source="test.api")
-
         # Test dict conversion
         event_dict = event.model_dump()
-        assert isinstance(event_dict, dict)
-        assert event_dict["event_type"] == "order.created"
+        assert event_dict["event_type"] == event_type.value
         assert "event_id" in event_dict
         assert "timestamp" in event_dict
 
         # Test JSON conversion
         event_json = event.model_dump_json()
         assert isinstance(event_json, str)
-        assert "order.created" in event_json
+        assert event_type.value in event_json
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"environment": "invalid"},
+            {"event_type": "not.an.event"},
+            {"timestamp": "not-a-timestamp"},
+        ],
+    )
+    def test_base_event_rejects_invalid_values(self, kwargs):
+        """Test invalid field values raise a validation error."""
+        with pytest.raises(ValidationError):
+            BaseEvent(**{"event_type": EventType.ORDER_CREATED, "source": "test.api", **kwargs})
 
-    def test_base_event_with_metadata(self):
+    def test_base_event_with_metadata(self, sample_events):
         """Test event with metadata."""
-        metadata = {"test_flag": True, "request_id": "req-123"}
-        event = BaseEvent(event_type=EventType.USER_LOGIN, source="auth.service", metadata=metadata)
+        event = sample_events["base_login"]
 
-        assert event.metadata == metadata
+        assert event.metadata == BASE_LOGIN_METADATA
 
     def test_base_event_correlation_id(self):
         """Test correlation ID functionality."""
-        from uuid import uuid4
-
         correlation_id = str(uuid4())
         event = BaseEvent(
             event_type=EventType.USER_SESSION,
@@ -63,35 +87,41 @@ class TestBaseEvent:
 
         assert str(event.correlation_id) == correlation_id
 
+    def test_get_event_key(self, sample_events):
+        """Test the partition key combines type, timestamp and id."""
+        event = sample_events["base_order"]
+
+        assert event.get_event_key() == (
+            f"order.created:{event.timestamp.isoformat()}:{event.event_id}"
+        )
+
+    def test_to_event_bridge_format(self, sample_events):
+        """Test EventBridge entry conversion."""
+        event = sample_events["base_order"]
+
+        entry = event.to_event_bridge_format()
+
+        assert entry["Source"] == "test.api"
+        assert entry["DetailType"] == "order.created"
+        assert entry["Detail"] == event.model_dump_json()
+        assert entry["Time"] == event.timestamp
+
 
 class TestUserEvents:
     """Test user-related events."""
 
-    def test_user_registered_event(self):
+    def test_user_registered_event(self, sample_events):
         """Test UserRegistered event."""
-        event = UserRegisteredEvent(
-            user_id="user123",
-            email="test@example.com",
-            username="testuser",
-            source="test.api",
-            registration_method="email",
-            terms_accepted=True,
-        )
+        event = sample_events["user_registered"]
 
         assert event.event_type == EventType.USER_REGISTERED
         assert event.user_id == "user123"
         assert event.email == "test@example.com"
         assert event.username == "testuser"
 
-    def test_user_login_event(self):
+    def test_user_login_event(self, sample_events):
         """Test UserLogin event."""
-        event = UserLoginEvent(
-            user_id="user123",
-            session_id="sess123",
-            source="test.api",
-            login_method="password",
-            login_successful=True,
-        )
+        event = sample_events["user_login"]
 
         assert event.event_type == EventType.USER_LOGIN
         assert event.user_id == "user123"
@@ -100,14 +130,7 @@ class TestUserEvents:
     def test_user_registered_validation(self):
         """Test UserRegistered validation."""
         # Minimal valid payload should not raise
-        evt = UserRegisteredEvent(
-            user_id="user123",
-            email="test@example.com",
-            username="testuser",
-            source="test.api",
-            registration_method="email",
-            terms_accepted=True,
-        )
+        evt = UserRegisteredEvent(**USER_REG_PAYLOAD)
         assert evt.email.endswith("@example.com")
 
 
@@ -116,21 +139,7 @@ class TestEcommerceEvents:
 
     def test_order_created_event(self):
         """Test OrderCreated event."""
-        event = OrderCreatedEvent(
-            user_id="user123",
-            order_id="order456",
-            source="checkout.service",
-            order_number="ORD-456",
-            order_total=99.99,
-            order_status="created",
-            items=[],
-            item_count=0,
-            customer_email="test@example.com",
-            shipping_address={"line1": "123 Test St", "city": "Testville"},
-            billing_address={"line1": "123 Test St", "city": "Testville"},
-            payment_method="credit_card",
-            shipping_method="standard",
-        )
+        event = OrderCreatedEvent(**ORDER_PAYLOAD)
 
         assert event.event_type == EventType.ORDER_CREATED
         assert event.user_id == "user123"
@@ -162,21 +171,7 @@ class TestPaymentEvents:
 
     def test_payment_processed_event(self):
         """Test PaymentProcessed event."""
-        event = PaymentProcessedEvent(
-            user_id="user123",
-            order_id="order456",
-            payment_id="pay789",
-            transaction_id="txn_1",
-            payment_amount=99.99,
-            payment_currency="USD",
-            processor="stripe",
-            processing_time_ms=120,
-            order_number="ORD-456",
-            customer_id="user123",
-            customer_email="test@example.com",
-            payment_method="credit_card",
-            source="payments.service",
-        )
+        event = PaymentProcessedEvent(**PAYMENT_PAYLOAD)
 
         assert event.event_type == EventType.PAYMENT_PROCESSED
         assert event.user_id == "user123"
@@ -192,14 +187,12 @@ class TestAnalyticsEvents:
 
     def test_user_session_event(self):
         """Test UserSession event."""
-        from datetime import datetime
-
         event = UserSessionEvent(
             user_id="user123",
             session_id="sess456",
             ip_address="192.168.1.1",
             user_agent="Mozilla/5.0...",
-            session_start=datetime.utcnow(),
+            session_start=FIXED_SESSION_START,
             device_type="desktop",
             browser="Chrome",
             operating_system="macOS",
@@ -212,7 +205,27 @@ class TestAnalyticsEvents:
         assert event.ip_address == "192.168.1.1"
         assert event.user_agent == "Mozilla/5.0..."
         # duration_seconds may be computed downstream; ensure required fields exist
-        assert event.session_start is not None
+        assert event.session_start == FIXED_SESSION_START
+
+    def test_user_session_conversion_events_default(self):
+        """Test conversion events default to a fresh empty list per session."""
+        session = {
+            "session_id": "sess456",
+            "ip_address": "192.168.1.1",
+            "user_agent": "Mozilla/5.0...",
+            "session_start": FIXED_SESSION_START,
+            "device_type": "desktop",
+            "browser": "Chrome",
+            "operating_system": "macOS",
+            "source": "web",
+        }
+        first = UserSessionEvent(**session)
+        second = UserSessionEvent(**session)
+
+        first.conversion_events.append("checkout")
+
+        assert first.conversion_events == ["checkout"]
+        assert second.conversion_events == []
 
 
 class TestEventSerialization:
@@ -221,77 +234,60 @@ class TestEventSerialization:
     @pytest.mark.parametrize(
         "event_class,event_data",
         [
-            (
-                UserRegisteredEvent,
-                {
-                    "user_id": "user123",
-                    "email": "test@example.com",
-                    "username": "testuser",
-                    "source": "test.api",
-                    "registration_method": "email",
-                    "terms_accepted": True,
-                },
-            ),
-            (
-                OrderCreatedEvent,
-                {
-                    "user_id": "user123",
-                    "order_id": "order456",
-                    "source": "checkout.service",
-                    "order_number": "ORD-456",
-                    "order_total": 99.99,
-                    "order_status": "created",
-                    "items": [],
-                    "item_count": 0,
-                    "customer_email": "test@example.com",
-                    "shipping_address": {"line1": "123 Test St"},
-                    "billing_address": {"line1": "123 Test St"},
-                    "payment_method": "credit_card",
-                    "shipping_method": "standard",
-                },
-            ),
-            (
-                PaymentProcessedEvent,
-                {
-                    "user_id": "user123",
-                    "order_id": "order456",
-                    "payment_id": "pay789",
-                    "payment_amount": 99.99,
-                    "payment_currency": "USD",
-                    "transaction_id": "txn_1",
-                    "processor": "stripe",
-                    "processing_time_ms": 120,
-                    "order_number": "ORD-456",
-                    "customer_id": "user123",
-                    "customer_email": "test@example.com",
-                    "payment_method": "credit_card",
-                    "source": "payments.service",
-                },
-            ),
+            (UserRegisteredEvent, USER_REG_PAYLOAD),
+            (OrderCreatedEvent, ORDER_PAYLOAD),
+            (PaymentProcessedEvent, PAYMENT_PAYLOAD),
         ],
     )
     def test_event_round_trip_serialization(self, event_class, event_data):
         """Test that events can be serialized and deserialized."""
-        # Create event
         original_event = event_class(**event_data)
 
-        # Serialize to dict
-        event_dict = original_event.model_dump()
+        recreated_event = event_class.model_validate(original_event.model_dump())
 
-        # Deserialize back
-        recreated_event = event_class.model_validate(event_dict)
+        # JSON mode renders Decimal/UUID/datetime as primitives, so one dict
+        # comparison covers every field
+        assert recreated_event.model_dump(mode="json") == original_event.model_dump(mode="json")
 
-        # Should be equivalent
-        assert recreated_event.event_type == original_event.event_type
-        assert recreated_event.event_id == original_event.event_id
-        assert recreated_event.timestamp == original_event.timestamp
 
-        # Test specific fields
-        from decimal import Decimal
+class TestEventModel:
+    """Test the discriminated EventModel union."""
+
+    def test_dispatches_on_event_type(self):
+        """Test the union resolves to the class matching event_type."""
+        event = parse_event(
+            b'{"event_type": "user.login", "user_id": "user123", "session_id": "sess123",'
+            b' "source": "test.api", "login_method": "password", "login_successful": true}'
+        )
+
+        assert isinstance(event, UserLoginEvent)
+        assert event.event_type == EventType.USER_LOGIN
 
-        for field_name, expected_value in event_data.items():
-            actual = getattr(recreated_event, field_name)
-            if isinstance(actual, Decimal) and isinstance(expected_value, int | float):
-                assert float(actual) == expected_value
-            else:
-                assert actual == expected_value
+    def test_round_trips_through_adapter(self, sample_events):
+        """Test a dumped event parses back to an equal event."""
+        event = sample_events["user_login"]
+
+        assert EVENT_ADAPTER.validate_json(event.model_dump_json()) == event
+
+    def test_any_event_supports_isinstance(self, sample_events):
+        """Test the bare AnyEvent union works with isinstance checks."""
+        assert isinstance(sample_events["user_login"], AnyEvent)
+        assert not isinstance(sample_events["base_login"], AnyEvent)
+
+    def test_rejects_mismatched_event_type(self):
+        """Test an event class only accepts its own event_type."""
+        with pytest.raises(ValidationError):
+            UserLoginEvent(
+                event_type=EventType.USER_LOGOUT,
+                user_id="user123",
+                session_id="sess123",
+                source="test.api",
+                login_method="password",
+                login_successful=True,
+            )
+
+    def test_event_type_to_class_covers_every_event_type(self):
+        """Test every EventType routes to the class that declares it."""
+        assert set(EVENT_TYPE_TO_CLASS) == set(EventType)
+        for event_type, event_class in EVENT_TYPE_TO_CLASS.items():
+            assert event_class.model_fields["event_type"].default == event_type
@@ -2,91 +2,41 @@
 Basic functionality tests to ensure the package works.
 """
 
-from datetime import datetime
-from uuid import UUID
+import ast
+import importlib
+import re
+import subprocess
+import sys
+from pathlib import Path
 
-from event_bridge_log_shared.models.events.base import BaseEvent, EventType
-
-
-class TestBasicFunctionality:
-    """Test basic package functionality."""
-
-    def test_base_event_creation(self):
-        """Test basic event creation."""
-        event = BaseEvent(event_type=EventType.USER_REGISTERED, source="test.source")
-
-        assert event.event_type == EventType.USER_REGISTERED
-        assert event.source == "test.source"
-        assert isinstance(event.event_id, UUID)
-        assert isinstance(event.timestamp, datetime)
-
-    def test_base_event_serialization(self):
-        """Test basic event serialization."""
-        event = BaseEvent(event_type=EventType.ORDER_CREATED, source="test.api")
-
-        # Test dict conversion
-        event_dict = event.model_dump()
-        assert isinstance(event_dict, dict)
-        assert event_dict["event_type"] == "order.created"
-        assert "event_id" in event_dict
-        assert "timestamp" in event_dict
-
-        # Test JSON conversion
-        event_json = event.model_dump_json()
-        assert isinstance(event_json, str)
-        assert "order.created" in event_json
-
-    def test_event_with_metadata(self):
-        """Test event with metadata."""
-        metadata = {"test_flag": True, "request_id": "req-123"}
-        event = BaseEvent(event_type=EventType.USER_LOGIN, source="auth.service", metadata=metadata)
-
-        assert event.metadata == metadata
-
-    def test_event_correlation_id(self):
-        """Test correlation ID functionality."""
-        from uuid import uuid4
-
-        correlation_id = str(uuid4())
-        event = BaseEvent(
-            event_type=EventType.USER_SESSION,
-            source="analytics.service",
-            correlation_id=correlation_id,
-        )
-
-        assert str(event.correlation_id) == correlation_id
+import pytest
 
 
 class TestPackageImports:
     """Test that package imports work correctly."""
 
-    def test_import_base_classes(self):
-        """Test importing base classes."""
-        from event_bridge_log_shared.models.events.base import BaseEvent, EventType
-
-        assert BaseEvent is not None
-        assert EventType is not None
-
-    def test_import_user_events(self):
-        """Test importing user event classes."""
-        from event_bridge_log_shared.models.events.user import (
-            UserLoginEvent,
-            UserLogoutEvent,
-            UserRegisteredEvent,
-        )
-
-        assert UserRegisteredEvent is not None
-        assert UserLoginEvent is not None
-        assert UserLogoutEvent is not None
-
-    def test_import_helpers(self):
-        """Test importing helper utilities."""
-        from event_bridge_log_shared.utils import build_role_arn, normalize_env, prefix_name
-
-        assert normalize_env("development") == "dev"
-        assert normalize_env("prod") == "prod"
-        assert prefix_name("dev", "events") == "dev-events"
-        assert build_role_arn("123456789012", "Role") == "arn:aws:iam::123456789012:role/Role"
+    @pytest.mark.parametrize(
+        "modname,attrs",
+        [
+            ("event_bridge_log_shared.models.events.base", ("BaseEvent", "EventType")),
+            (
+                "event_bridge_log_shared.models.events.user",
+                ("UserRegisteredEvent", "UserLoginEvent", "UserLogoutEvent"),
+            ),
+            (
+                "event_bridge_log_shared.models.events",
+                ("AnyEvent", "EventModel", "EVENT_ADAPTER", "EVENT_TYPE_TO_CLASS", "parse_event"),
+            ),
+            ("event_bridge_log_shared.models", ("BaseEvent", "PageViewEvent", "parse_event")),
+            ("event_bridge_log_shared.utils", ("build_role_arn", "normalize_env", "prefix_name")),
+        ],
+    )
+    def test_package_imports(self, modname, attrs):
+        """Test public names resolve from each package module."""
+        module = importlib.import_module(modname)
+
+        for attr in attrs:
+            assert getattr(module, attr) is not None
 
     def test_package_level_imports(self):
         """Test package-level imports work."""
@@ -94,7 +44,53 @@ class TestPackageImports:
 
         # Should have version
         assert hasattr(event_bridge_log_shared, "__version__")
-        import re
-
         assert isinstance(event_bridge_log_shared.__version__, str)
         assert re.match(r"^\d+\.\d+\.\d+$", event_bridge_log_shared.__version__)
+
+    def test_event_submodules_load_lazily(self):
+        """Test importing one event module does not load the other domains."""
+        code = (
+            "import sys\n"
+            "import event_bridge_log_shared.models.events.payment\n"
+            "loaded = {m.rsplit('.', 1)[-1] for m in sys.modules"
+            " if m.startswith('event_bridge_log_shared.models.events.')}\n"
+            "assert loaded == {'base', 'payment'}, loaded\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    @pytest.mark.parametrize(
+        "modname", ["event_bridge_log_shared.models", "event_bridge_log_shared.models.events"]
+    )
+    def test_lazy_exports_stay_in_sync(self, modname):
+        """Test the TYPE_CHECKING imports, __all__ and runtime lookups name the same things."""
+        module = importlib.import_module(modname)
+        tree = ast.parse(Path(module.__file__).read_text(encoding="utf-8"))
+        type_checking_block = next(
+            node
+            for node in tree.body
+            if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+        )
+        type_checked = {
+            alias.name
+            for node in type_checking_block.body
+            if isinstance(node, ast.ImportFrom)
+            for alias in node.names
+        }
+
+        assert type_checked == set(module.__all__)
+        assert not {"Any", "TYPE_CHECKING", "importlib"} & set(dir(module))
+        for name in module.__all__:
+            assert getattr(module, name) is not None
+
+    def test_event_submodules_resolve_as_attributes(self):
+        """Test submodules stay reachable as attributes of the lazy package."""
+        code = (
+            "import event_bridge_log_shared.models as models\n"
+            "from event_bridge_log_shared.models import events\n"
+            "assert models.events is events\n"
+            "assert events.user.UserLoginEvent is events.UserLoginEvent\n"
+            "assert 'user' in dir(events)\n"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)